@@ -28,6 +28,31 @@ HEIGHTS = [0.25, 0.50, 0.75, 1.00, 1.25]  # meters
 PLANE_LENGTHS = [0.50, 1.00, 1.50, 2.00, 2.50]  # meters
 EXP_AVG_SPEEDS = [1.11, 1.0, 1.5, 2.0, 2.5]  # m/s
 EXP_STD_DEVS = [0.03, 0.04, 0.03, 0.03, 0.04]  # m/s
+_HEIGHT_IDX = {h: i for i, h in enumerate(HEIGHTS)}
+H_ARR = np.array(HEIGHTS)
+V_EXP_ARR = np.array(EXP_AVG_SPEEDS)
+
+def power_law(h, A_fit, p):
+    return A_fit * h ** p
+
+def power_law_jac(h, A_fit, p):
+    # d/dA_fit and d/dp of power_law, so curve_fit can skip finite differences
+    return np.stack([h ** p, A_fit * (h ** p) * np.log(h)], axis=1)
+
+# Theoretical run time and average speed for each plane length
+T_THEORY = [math.sqrt(2 * L / A) for L in PLANE_LENGTHS]
+V_THEORY = [L / t for L, t in zip(PLANE_LENGTHS, T_THEORY)]
+
+# Fits to the experimental data (computed once; the data never changes)
+SLOPE, INTERCEPT, R_VALUE, _, _ = stats.linregress(H_ARR, V_EXP_ARR)
+R2 = R_VALUE ** 2
+(A_FIT, P_FIT), _ = curve_fit(power_law, H_ARR, V_EXP_ARR, p0=[1.0, 0.5],
+                              jac=power_law_jac, check_finite=False, xtol=1e-5)
+
+# Fit curves sampled over the graph's s-axis
+X_VALS = np.linspace(0, PLANE_LENGTHS[-1], 100)
+V_LINEAR = SLOPE * (X_VALS / 2) + INTERCEPT
+V_POWER = A_FIT * (X_VALS / 2) ** P_FIT
 
 # Colors
 WHITE = (255, 255, 255)
@@ -39,24 +64,48 @@ BLACK = (0, 0, 0)
 LIGHT_BLUE = (200, 200, 255)
 GREEN = (0, 200, 0)
 YELLOW = (255, 255, 0)
+FRAME_KEY = (255, 0, 255)  # Colour key for the transparent margin of the graph frame
+
+def step(t, dt, L, x0, y0, kx, ky):
+    """Advance the block by dt; returns (t, s, block_x, block_y)."""
+    t += dt
+    s = 0.5 * A * t * t
+    if s > L:
+        s = L
+    return t, s, x0 + s * kx, y0 + s * ky
+
+def _mk_text(font, text, color):
+    # Text surfaces are cached and blitted many times, so match the display format up front
+    return font.render(text, True, color).convert_alpha()
 
 class Button:
     def __init__(self, x, y, width, height, text, color=NAVY, hover_color=LIGHT_BLUE, text_color=WHITE):
         self.rect = pygame.Rect(x, y, width, height)
-        self.text = text
         self.color = color
         self.hover_color = hover_color
         self.text_color = text_color
         self.font = pygame.font.SysFont('Arial', 18)
+        self.text = text
         self.clicked = False
 
+    @property
+    def text(self):
+        return self._text
+
+    @text.setter
+    def text(self, value):
+        # Re-render the label only when it actually changes
+        if getattr(self, '_text', None) == value:
+            return
+        self._text = value
+        self._text_surf = _mk_text(self.font, value, self.text_color)
+        self._text_rect = self._text_surf.get_rect(center=self.rect.center)
+
     def draw(self, surface, is_hovered):
         color = self.hover_color if is_hovered else self.color
         pygame.draw.rect(surface, color, self.rect, border_radius=5)
         pygame.draw.rect(surface, BLACK, self.rect, 2, border_radius=5)
-        text_surf = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        surface.blit(text_surf, text_rect)
+        surface.blit(self._text_surf, self._text_rect)
 
     def is_hovered(self, mouse_pos):
         return self.rect.collidepoint(mouse_pos)
@@ -70,117 +119,149 @@ class Button:
 class GraphPlot:
     def __init__(self, x, y, width, height):
         self.rect = pygame.Rect(x, y, width, height)
-        self.points = []  # (s, v) pairs
+        # (s, v) samples in growable arrays; capacity doubles when full
+        self._s = np.empty(256)
+        self._v = np.empty_like(self._s)
+        self._n = 0
         self.font = pygame.font.SysFont('Arial', 14)
+        self._s_label = _mk_text(self.font, "s (m)", BLACK)
+        self._v_label = _mk_text(self.font, "v (m/s)", BLACK)
+        self._frame_surf = self._build_frame()
+        self._dot = pygame.Surface((5, 5), pygame.SRCALPHA).convert_alpha()
+        pygame.draw.circle(self._dot, RED, (2, 2), 2)
+        # Speeds near the end of the longer runs exceed the 4 m/s axis and are plotted
+        # above the rect, as they always were; the overlays extend upwards to hold them
+        v_peak = A * (T_THEORY[-1] + 1.0 / FPS)
+        self._overflow = max(0, math.ceil((v_peak / 4.0) * (height - 40) - (height - 20)) + 2)
+        self.overlay_rect = pygame.Rect(x, y - self._overflow, width, height + self._overflow)
+        # Trail points sit beneath the fit curves, so each gets its own overlay
+        self._points_surf = pygame.Surface(self.overlay_rect.size, pygame.SRCALPHA).convert_alpha()
+        self._fit_surf = pygame.Surface(self.overlay_rect.size, pygame.SRCALPHA).convert_alpha()
+        self._points_n = 0  # points already stamped onto the points overlay
+        self._fit_height = None  # height the fit overlay was drawn for
 
     def add_point(self, s, v):
-        self.points.append((s, v))
+        if self._n == len(self._s):
+            self._s = np.concatenate((self._s, np.empty_like(self._s)))
+            self._v = np.concatenate((self._v, np.empty_like(self._v)))
+        self._s[self._n] = s
+        self._v[self._n] = v
+        self._n += 1
+
+    def _build_frame(self):
+        # Plot area and axes, drawn over the buttons each frame as before. The axis lines
+        # end on rect.right / rect.bottom, one pixel past the rect, so the surface has a
+        # one-pixel colour-keyed margin that leaves whatever is underneath untouched.
+        w, h = self.rect.size
+        frame = pygame.Surface((w + 1, h + 1)).convert()
+        frame.fill(FRAME_KEY)
+        frame.set_colorkey(FRAME_KEY, pygame.RLEACCEL)
+        pygame.draw.rect(frame, WHITE, (0, 0, w, h))
+        pygame.draw.rect(frame, BLACK, (0, 0, w, h), 1)
+        pygame.draw.line(frame, BLACK, (0, h - 20), (w, h - 20), 2)
+        pygame.draw.line(frame, BLACK, (20, 0), (20, h), 2)
+        return frame
+
+    def _to_plot(self, s, v):
+        # Map (s, v) arrays to integer coordinates local to the overlays
+        xs = 20 + (s / PLANE_LENGTHS[-1]) * (self.rect.width - 40)
+        ys = self._overflow + self.rect.height - 20 - (v / 4.0) * (self.rect.height - 40)
+        return xs.astype(int).tolist(), ys.astype(int).tolist()
+
+    def _stamp_points(self, start):
+        s_pts = self._s[start:self._n]
+        v_pts = self._v[start:self._n]
+        keep = s_pts <= PLANE_LENGTHS[-1]
+        xs, ys = self._to_plot(s_pts[keep], v_pts[keep])
+        self._points_surf.blits([(self._dot, (x - 2, y - 2)) for x, y in zip(xs, ys)], doreturn=False)
+        self._points_n = self._n
+
+    def _render_fits(self, selected_height):
+        self._fit_surf.fill((0, 0, 0, 0))
+        if selected_height in _HEIGHT_IDX:
+            idx = _HEIGHT_IDX[selected_height]
+            xs, ys_linear = self._to_plot(X_VALS, V_LINEAR)
+            _, ys_power = self._to_plot(X_VALS, V_POWER)
+            pygame.draw.lines(self._fit_surf, GREEN, False, list(zip(xs, ys_linear)), 1)
+            pygame.draw.lines(self._fit_surf, YELLOW, False, list(zip(xs, ys_power)), 1)
+
+            (x_h,), (y_h,) = self._to_plot(np.array([PLANE_LENGTHS[idx]]), V_EXP_ARR[idx:idx + 1])
+            pygame.draw.circle(self._fit_surf, BLACK, (x_h, y_h), 5)
+        self._fit_height = selected_height
 
     def draw(self, surface, selected_height):
-        pygame.draw.rect(surface, WHITE, self.rect)
-        pygame.draw.rect(surface, BLACK, self.rect, 1)
-
-        x_axis_y = self.rect.bottom - 20
-        y_axis_x = self.rect.left + 20
-        pygame.draw.line(surface, BLACK, (self.rect.left, x_axis_y), (self.rect.right, x_axis_y), 2)
-        pygame.draw.line(surface, BLACK, (y_axis_x, self.rect.top), (y_axis_x, self.rect.bottom), 2)
-
-        surface.blit(self.font.render("s (m)", True, BLACK), (self.rect.right - 30, x_axis_y + 5))
-        surface.blit(self.font.render("v (m/s)", True, BLACK), (y_axis_x - 15, self.rect.top - 15))
-
-        max_s = PLANE_LENGTHS[-1]
-        max_v = 4.0
-        for s, v in self.points:
-            if s > max_s:
-                continue
-            x = self.rect.left + 20 + (s / max_s) * (self.rect.width - 40)
-            y = self.rect.bottom - 20 - (v / max_v) * (self.rect.height - 40)
-            pygame.draw.circle(surface, RED, (int(x), int(y)), 2)
-
-        if selected_height in HEIGHTS:
-            idx = HEIGHTS.index(selected_height)
-            L = PLANE_LENGTHS[idx]
-            h_array = np.array(HEIGHTS)
-            v_exp = np.array(EXP_AVG_SPEEDS)
-            slope, intercept, r_value, _, _ = stats.linregress(h_array, v_exp)
-            x_vals = np.linspace(0, max_s, 100)
-            v_linear = slope * (x_vals / 2) + intercept
-            for i in range(len(x_vals) - 1):
-                x1 = self.rect.left + 20 + (x_vals[i] / max_s) * (self.rect.width - 40)
-                y1 = self.rect.bottom - 20 - (v_linear[i] / max_v) * (self.rect.height - 40)
-                x2 = self.rect.left + 20 + (x_vals[i + 1] / max_s) * (self.rect.width - 40)
-                y2 = self.rect.bottom - 20 - (v_linear[i + 1] / max_v) * (self.rect.height - 40)
-                pygame.draw.line(surface, GREEN, (x1, y1), (x2, y2), 1)
-
-            def power_law(h, A_fit, p):
-                return A_fit * h ** p
-            popt, _ = curve_fit(power_law, h_array, v_exp)
-            A_fit, p = popt
-            v_power = power_law(x_vals / 2, A_fit, p)
-            for i in range(len(x_vals) - 1):
-                x1 = self.rect.left + 20 + (x_vals[i] / max_s) * (self.rect.width - 40)
-                y1 = self.rect.bottom - 20 - (v_power[i] / max_v) * (self.rect.height - 40)
-                x2 = self.rect.left + 20 + (x_vals[i + 1] / max_s) * (self.rect.width - 40)
-                y2 = self.rect.bottom - 20 - (v_power[i + 1] / max_v) * (self.rect.height - 40)
-                pygame.draw.line(surface, YELLOW, (x1, y1), (x2, y2), 1)
-
-            s_highlight = L
-            v_highlight = v_exp[idx]
-            x_h = self.rect.left + 20 + (s_highlight / max_s) * (self.rect.width - 40)
-            y_h = self.rect.bottom - 20 - (v_highlight / max_v) * (self.rect.height - 40)
-            pygame.draw.circle(surface, BLACK, (int(x_h), int(y_h)), 5)
+        # The plot overlaps the Reset button, so it is drawn here, after the buttons
+        surface.blit(self._frame_surf, self.rect.topleft)
+        surface.blit(self._s_label, (self.rect.right - 30, self.rect.bottom - 15))
+        surface.blit(self._v_label, (self.rect.left + 5, self.rect.top - 15))
+
+        # Points and fits are kept on transparent overlays: new points are stamped
+        # as they arrive and the fits are redrawn only when the height changes
+        if self._points_n < self._n:
+            self._stamp_points(self._points_n)
+        if selected_height != self._fit_height:
+            self._render_fits(selected_height)
+        surface.blit(self._points_surf, self.overlay_rect.topleft)
+        surface.blit(self._fit_surf, self.overlay_rect.topleft)
 
     def clear(self):
-        self.points = []
+        self._n = 0
+        self._points_n = 0
+        self._points_surf.fill((0, 0, 0, 0))
 
 class InclineScene:
     def __init__(self, x, y, width, height):
         self.rect = pygame.Rect(x, y, width, height)
         self.incline_start = (self.rect.left + 50, self.rect.top + 50)
+        self._incline_end = (self.incline_start[0] + L_PIXEL_MAX * COS_THETA,
+                             self.incline_start[1] + L_PIXEL_MAX * SIN_THETA)
+        # Tick marks every 0.5 m along the incline
+        self._ticks = []
+        for i in range(0, int(L_PHYSICAL_MAX * 2) + 1):
+            pixel_s = (i * 0.5 / L_PHYSICAL_MAX) * L_PIXEL_MAX
+            self._ticks.append((int(self.incline_start[0] + pixel_s * COS_THETA),
+                                int(self.incline_start[1] + pixel_s * SIN_THETA)))
         self.block_size = 30
-        self.block_pos = self.incline_start
-        self.t = 0
+        # Pixels moved per metre travelled along the incline
+        self._kx = (COS_THETA / L_PHYSICAL_MAX) * L_PIXEL_MAX
+        self._ky = (SIN_THETA / L_PHYSICAL_MAX) * L_PIXEL_MAX
+        self.block_x, self.block_y = self.incline_start
+        self.t = 0.0
         self.s = 0
         self.L = PLANE_LENGTHS[0]
+        self._prev_block_rect = None
 
     def set_height(self, h):
-        idx = HEIGHTS.index(h)
+        idx = _HEIGHT_IDX[h]
         self.L = PLANE_LENGTHS[idx]
         self.reset()
 
     def reset(self):
-        self.block_pos = self.incline_start
-        self.t = 0
+        self.block_x, self.block_y = self.incline_start
+        self.t = 0.0
         self.s = 0
 
     def update(self, dt):
         if self.s < self.L:
-            self.t += dt
-            self.s = 0.5 * A * self.t ** 2
-            if self.s > self.L:
-                self.s = self.L
-            pixel_s = (self.s / L_PHYSICAL_MAX) * L_PIXEL_MAX
-            delta_x = pixel_s * COS_THETA
-            delta_y = pixel_s * SIN_THETA
-            self.block_pos = (self.incline_start[0] + delta_x, self.incline_start[1] + delta_y)
+            self.t, self.s, self.block_x, self.block_y = step(
+                self.t, dt, self.L, self.incline_start[0], self.incline_start[1], self._kx, self._ky)
         return self.s, A * self.t
 
+    def draw_static(self, surface):
+        # Incline and tick marks; drawn once into the background
+        pygame.draw.line(surface, DARK_GRAY, self.incline_start, self._incline_end, 5)
+        for pt in self._ticks:
+            pygame.draw.circle(surface, BLACK, pt, 3)
+
     def draw(self, surface):
-        incline_end = (self.incline_start[0] + L_PIXEL_MAX * COS_THETA, 
-                       self.incline_start[1] + L_PIXEL_MAX * SIN_THETA)
-        pygame.draw.line(surface, DARK_GRAY, self.incline_start, incline_end, 5)
-        
-        for i in range(0, int(L_PHYSICAL_MAX * 2) + 1):
-            s = i * 0.5
-            pixel_s = (s / L_PHYSICAL_MAX) * L_PIXEL_MAX
-            x = self.incline_start[0] + pixel_s * COS_THETA
-            y = self.incline_start[1] + pixel_s * SIN_THETA
-            pygame.draw.circle(surface, BLACK, (int(x), int(y)), 3)
-
-        block_rect = pygame.Rect(self.block_pos[0] - self.block_size // 2, 
-                                 self.block_pos[1] - self.block_size // 2, 
+        """Draw the block; returns the area covering its old and new positions."""
+        block_rect = pygame.Rect(self.block_x - self.block_size // 2,
+                                 self.block_y - self.block_size // 2,
                                  self.block_size, self.block_size)
         pygame.draw.rect(surface, RED, block_rect)
+        dirty = block_rect.union(self._prev_block_rect) if self._prev_block_rect else block_rect
+        self._prev_block_rect = block_rect
+        return dirty
 
 class SimulationController:
     def __init__(self):
@@ -195,10 +276,62 @@ class SimulationController:
         ]
         self.start_button = Button(LEFT_PANEL_WIDTH + 20, 350, 150, 30, "Start")
         self.reset_button = Button(LEFT_PANEL_WIDTH + 20, 390, 150, 30, "Reset")
+        self._all_buttons = self.buttons + [self.start_button, self.reset_button]
+        self._btn_rects = np.array([[b.rect.x, b.rect.y, b.rect.w, b.rect.h] for b in self._all_buttons],
+                                   dtype=np.int32)
         self.font = pygame.font.SysFont('Arial', 18)
         self.header_font = pygame.font.SysFont('Arial', 24, bold=True)
         self.fit_results = None
         self.match_status = ""
+        self._on_height_change()
+        self._on_fit_update()
+        self._background = self._build_background()
+        self._hovered = [False] * len(self._all_buttons)
+        self._full_redraw = True
+        # Screen areas that can change without a click
+        self._fps_rect = pygame.Rect(10, 10, 100, self.font.get_linesize())
+        self._dynamic_rect = pygame.Rect(LEFT_PANEL_WIDTH, 600 + len(self._static_labels) * 20,
+                                         RIGHT_PANEL_WIDTH, 2 * 20)
+
+    def _build_background(self):
+        # Everything that never changes, blitted in one go each frame
+        background = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        background.fill(LIGHT_GRAY)
+        pygame.draw.rect(background, LIGHT_BLUE, (LEFT_PANEL_WIDTH, 0, RIGHT_PANEL_WIDTH, WINDOW_HEIGHT))
+        header = _mk_text(self.header_font, "Inclined-Plane Velocity Simulation", BLACK)
+        background.blit(header, (WINDOW_WIDTH // 2 - header.get_width() // 2, 20))
+        self.scene.draw_static(background)
+        return background
+
+    def _on_height_change(self):
+        # Labels that depend only on the selected height
+        idx = _HEIGHT_IDX[self.selected_height]
+        L = PLANE_LENGTHS[idx]
+        t_theory = T_THEORY[idx]
+        v_theory = V_THEORY[idx]
+        self._static_labels = [_mk_text(self.font, text, BLACK) for text in [
+            f"Height: {self.selected_height:.2f} m",
+            f"Length: {L:.2f} m",
+            f"Exp. Avg. Speed: {EXP_AVG_SPEEDS[idx]:.2f} m/s",
+            f"Exp. SD: {EXP_STD_DEVS[idx]:.2f} m/s",
+            f"Theor. Avg. Speed: {v_theory:.2f} m/s",
+            f"Theor. Time: {t_theory:.2f} s"
+        ]]
+
+    def _on_fit_update(self):
+        # Labels that change only when a run finishes or is cleared
+        result_texts = []
+        if self.match_status:
+            result_texts.append(f"Match: {self.match_status}")
+        if self.fit_results:
+            slope, intercept, r2 = self.fit_results['linear']
+            A_fit, p = self.fit_results['power']
+            result_texts.extend([
+                f"Linear Fit: v = {slope:.2f}h + {intercept:.2f}",
+                f"Linear R²: {r2:.4f}",
+                f"Power Fit: v = {A_fit:.2f}h^{p:.2f}"
+            ])
+        self._result_labels = [_mk_text(self.font, text, BLACK) for text in result_texts]
 
     def handle_events(self, events, mouse_pos):
         for event in events:
@@ -206,6 +339,9 @@ class SimulationController:
                 return False
             if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                 return False
+            if event.type in (pygame.MOUSEBUTTONDOWN, pygame.VIDEOEXPOSE,
+                              pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED):
+                self._full_redraw = True
             for btn in self.buttons:
                 if btn.is_clicked(event, mouse_pos):
                     self.selected_height = float(btn.text.split('=')[1].strip().split()[0])
@@ -216,6 +352,8 @@ class SimulationController:
                     self.graph.clear()
                     self.fit_results = None
                     self.match_status = ""
+                    self._on_height_change()
+                    self._on_fit_update()
             if self.start_button.is_clicked(event, mouse_pos):
                 if not self.running:
                     self.running = True
@@ -232,6 +370,7 @@ class SimulationController:
                 self.graph.clear()
                 self.fit_results = None
                 self.match_status = ""
+                self._on_fit_update()
         return True
 
     def update(self, dt):
@@ -241,72 +380,57 @@ class SimulationController:
             if s >= self.scene.L:
                 self.running = False
                 self.start_button.text = "Start"
-                idx = HEIGHTS.index(self.selected_height)
+                self._full_redraw = True
+                idx = _HEIGHT_IDX[self.selected_height]
                 actual_time = self.scene.t
                 measured_v = self.scene.L / actual_time if actual_time > 0 else 0
                 exp_v = EXP_AVG_SPEEDS[idx]
                 exp_sd = EXP_STD_DEVS[idx]
                 self.match_status = "Success" if abs(measured_v - exp_v) <= exp_sd else "Deviation"
-                h_array = np.array(HEIGHTS)
-                v_exp = np.array(EXP_AVG_SPEEDS)
-                slope, intercept, r_value, _, _ = stats.linregress(h_array, v_exp)
-                def power_law(h, A_fit, p):
-                    return A_fit * h ** p
-                popt, _ = curve_fit(power_law, h_array, v_exp)
-                A_fit, p = popt
                 self.fit_results = {
-                    'linear': (slope, intercept, r_value ** 2),
-                    'power': (A_fit, p)
+                    'linear': (SLOPE, INTERCEPT, R2),
+                    'power': (A_FIT, P_FIT)
                 }
+                self._on_fit_update()
 
-    def draw(self, surface):
-        surface.fill(LIGHT_GRAY)
-        pygame.draw.rect(surface, LIGHT_BLUE, (LEFT_PANEL_WIDTH, 0, RIGHT_PANEL_WIDTH, WINDOW_HEIGHT))
-        
-        header = self.header_font.render("Inclined-Plane Velocity Simulation", True, BLACK)
-        surface.blit(header, (WINDOW_WIDTH // 2 - header.get_width() // 2, 20))
+    def draw(self, surface, mouse_pos):
+        """Draw the frame; returns the list of rects that need updating on screen."""
+        surface.blit(self._background, (0, 0))
 
-        self.scene.draw(surface)
+        dirty = [self.scene.draw(surface), self._fps_rect, self._dynamic_rect]
 
-        mouse_pos = pygame.mouse.get_pos()
-        for btn in self.buttons:
-            is_hovered = btn.is_hovered(mouse_pos)
+        mx, my = mouse_pos
+        bx, by, bw, bh = self._btn_rects.T
+        hovered = ((mx >= bx) & (mx < bx + bw) & (my >= by) & (my < by + bh)).tolist()
+        for btn, is_hovered, was_hovered in zip(self._all_buttons, hovered, self._hovered):
             btn.draw(surface, is_hovered)
-        self.start_button.draw(surface, self.start_button.is_hovered(mouse_pos))
-        self.reset_button.draw(surface, self.reset_button.is_hovered(mouse_pos))
-
-        idx = HEIGHTS.index(self.selected_height)
-        L = PLANE_LENGTHS[idx]
-        t_theory = math.sqrt(2 * L / A)
-        v_theory = L / t_theory
-        data_texts = [
-            f"Height: {self.selected_height:.2f} m",
-            f"Length: {L:.2f} m",
-            f"Exp. Avg. Speed: {EXP_AVG_SPEEDS[idx]:.2f} m/s",
-            f"Exp. SD: {EXP_STD_DEVS[idx]:.2f} m/s",
-            f"Theor. Avg. Speed: {v_theory:.2f} m/s",
-            f"Theor. Time: {t_theory:.2f} s",
-            f"Elapsed Time: {self.scene.t:.2f} s",
-            f"Inst. Speed: {A * self.scene.t:.2f} m/s"
-        ]
-        if self.match_status:
-            data_texts.append(f"Match: {self.match_status}")
-        if self.fit_results:
-            slope, intercept, r2 = self.fit_results['linear']
-            A_fit, p = self.fit_results['power']
-            data_texts.extend([
-                f"Linear Fit: v = {slope:.2f}h + {intercept:.2f}",
-                f"Linear R²: {r2:.4f}",
-                f"Power Fit: v = {A_fit:.2f}h^{p:.2f}"
-            ])
-        for i, text in enumerate(data_texts):
-            surface.blit(self.font.render(text, True, BLACK), (LEFT_PANEL_WIDTH + 20, 600 + i * 20))
+            if is_hovered != was_hovered:
+                dirty.append(btn.rect)
+        self._hovered = hovered
+
+        x, y = LEFT_PANEL_WIDTH + 20, 600
+        for label in self._static_labels:
+            surface.blit(label, (x, y))
+            y += 20
+        for text in (f"Elapsed Time: {self.scene.t:.2f} s", f"Inst. Speed: {A * self.scene.t:.2f} m/s"):
+            surface.blit(self.font.render(text, True, BLACK), (x, y))
+            y += 20
+        for label in self._result_labels:
+            surface.blit(label, (x, y))
+            y += 20
 
         self.graph.draw(surface, self.selected_height)
 
         fps = str(int(clock.get_fps()))
         surface.blit(self.font.render(f"FPS: {fps}", True, BLACK), (10, 10))
 
+        if self.running:
+            dirty.append(self.graph.overlay_rect)
+        if self._full_redraw:
+            self._full_redraw = False
+            return [surface.get_rect()]
+        return dirty
+
 async def main():
     pygame.init()
     screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
@@ -321,8 +445,8 @@ async def main():
         mouse_pos = pygame.mouse.get_pos()
         running = controller.handle_events(events, mouse_pos)
         controller.update(1.0 / FPS)
-        controller.draw(screen)
-        pygame.display.flip()
+        dirty = controller.draw(screen, mouse_pos)
+        pygame.display.update(dirty)
         clock.tick(FPS)
         await asyncio.sleep(1.0 / FPS)
 